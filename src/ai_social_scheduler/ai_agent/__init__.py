@@ -1,17 +1,25 @@
-"""AI Agent 层 - 核心业务逻辑"""
-
-from .supervisor import Supervisor, DecisionEngine, StrategyManager, StateManager
-from .workflows import (
-    BaseWorkflow,
-    ContentPublishWorkflow,
-    AutoReplyWorkflow,
-    ScheduledPublishWorkflow,
-    HotTopicTrackingWorkflow,
-    ExceptionHandlingWorkflow,
-    CompetitorAnalysisWorkflow,
-    MessageHandlingWorkflow,
-    PerformanceAnalysisWorkflow,
-)
+"""AI Agent 层 - 核心业务逻辑
+
+导出的类按需加载（PEP 562）：导入子模块（如 ``ai_agent.client``）时，
+不会连带导入 Supervisor 和工作流所依赖的 LangGraph 等重量级依赖。
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .supervisor import Supervisor, DecisionEngine, StrategyManager, StateManager
+    from .workflows import (
+        BaseWorkflow,
+        ContentPublishWorkflow,
+        AutoReplyWorkflow,
+        ScheduledPublishWorkflow,
+        HotTopicTrackingWorkflow,
+        ExceptionHandlingWorkflow,
+        CompetitorAnalysisWorkflow,
+        MessageHandlingWorkflow,
+        PerformanceAnalysisWorkflow,
+    )
 
 __all__ = [
     # Supervisor
@@ -31,3 +39,33 @@ __all__ = [
     "PerformanceAnalysisWorkflow",
 ]
 
+# 导出名称 -> 定义模块
+_LAZY_IMPORTS = {
+    "Supervisor": ".supervisor",
+    "DecisionEngine": ".supervisor",
+    "StrategyManager": ".supervisor",
+    "StateManager": ".supervisor",
+    "BaseWorkflow": ".workflows",
+    "ContentPublishWorkflow": ".workflows",
+    "AutoReplyWorkflow": ".workflows",
+    "ScheduledPublishWorkflow": ".workflows",
+    "HotTopicTrackingWorkflow": ".workflows",
+    "ExceptionHandlingWorkflow": ".workflows",
+    "CompetitorAnalysisWorkflow": ".workflows",
+    "MessageHandlingWorkflow": ".workflows",
+    "PerformanceAnalysisWorkflow": ".workflows",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """首次访问时导入导出类，并缓存到模块全局变量中"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
@@ -1,18 +1,93 @@
 """小红书MCP服务智能体"""
 
 import asyncio
-from typing import Any, Dict, Optional
+import weakref
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.messages import HumanMessage
-from langchain_mcp_adapters.client import MultiServerMCPClient
-from langchain.agents import create_agent
 
-from ....client import QwenClient
+from ....client import QwenClient, get_qwen_client
 from .....config import mcp_config
 from ....tools.logging import get_logger
 
+if TYPE_CHECKING:
+    from langchain_mcp_adapters.client import MultiServerMCPClient
+
 logger = get_logger(__name__)
 
+# 便捷方法所需能力 -> 按优先级排列的工具名匹配规则（参数为小写工具名）
+_CAPABILITY_MATCHERS: Dict[str, Tuple[Callable[[str], bool], ...]] = {
+    "login_status": (
+        lambda name: "login" in name and "status" in name,
+        lambda name: "check_login" in name,
+    ),
+    "publish_content": (
+        lambda name: "publish_content" in name,
+    ),
+    "publish_with_video": (
+        lambda name: "video" in name,
+    ),
+}
+
+
+def _index_tools_by_capability(tools: List[Any]) -> Dict[str, Any]:
+    """按能力预先解析工具，便捷方法调用时直接查表"""
+    lowered = [(tool.name.lower(), tool) for tool in tools]
+    index: Dict[str, Any] = {}
+    for capability, matchers in _CAPABILITY_MATCHERS.items():
+        for matcher in matchers:
+            tool = next((tool for name, tool in lowered if matcher(name)), None)
+            if tool is not None:
+                index[capability] = tool
+                break
+    return index
+
+
+# (mcp_url, transport) -> (MCP 客户端, 工具列表)，连接同一服务的 agent 实例共享
+_mcp_tools_cache: Dict[Tuple[str, str], Tuple["MultiServerMCPClient", List[Any]]] = {}
+# 事件循环 -> 拉取工具时使用的锁（asyncio.Lock 与首次等待它的事件循环绑定，不能跨循环共用）
+_mcp_tools_locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _get_mcp_tools_lock() -> asyncio.Lock:
+    """获取当前事件循环的工具拉取锁"""
+    loop = asyncio.get_running_loop()
+    lock = _mcp_tools_locks.get(loop)
+    if lock is None:
+        lock = _mcp_tools_locks[loop] = asyncio.Lock()
+    return lock
+
+
+async def _get_mcp_tools(url: str, transport: str) -> Tuple["MultiServerMCPClient", List[Any]]:
+    """获取 MCP 客户端和工具列表（按服务地址缓存，只在首次访问时拉取工具）"""
+    key = (url, transport)
+    cached = _mcp_tools_cache.get(key)
+    if cached is not None:
+        return cached
+
+    async with _get_mcp_tools_lock():
+        cached = _mcp_tools_cache.get(key)
+        if cached is None:
+            from langchain_mcp_adapters.client import MultiServerMCPClient
+
+            client = MultiServerMCPClient({
+                "xiaohongshu": {
+                    "url": url,
+                    "transport": transport,
+                }
+            })
+            logger.info("Fetching MCP tools...", mcp_url=url, transport=transport)
+            tools = await client.get_tools()
+            cached = _mcp_tools_cache[key] = (client, tools)
+    return cached
+
+
+def _invalidate_mcp_tools(url: str, transport: str) -> None:
+    """丢弃缓存的 MCP 客户端和工具列表，下次初始化时重新连接并拉取"""
+    _mcp_tools_cache.pop((url, transport), None)
+
 
 async def create_xiaohongshu_mcp_agent(
     name: str = "xiaohongshu_mcp",
@@ -81,8 +156,9 @@ class XiaohongshuMCPAgent:
         self.logger = logger
         
         # 延迟初始化的组件
-        self._mcp_client: Optional[MultiServerMCPClient] = None
+        self._mcp_client: Optional["MultiServerMCPClient"] = None
         self._tools = None
+        self._capability_tools: Dict[str, Any] = {}
         self._agent = None
         self._llm_client: Optional[QwenClient] = None
         self._initialized = False
@@ -92,6 +168,9 @@ class XiaohongshuMCPAgent:
         if self._initialized:
             return
         
+        # agent 构建依赖较重，只在首次初始化时导入
+        from langchain.agents import create_agent
+
         try:
             self.logger.info(
                 "Initializing Xiaohongshu MCP Agent",
@@ -100,33 +179,27 @@ class XiaohongshuMCPAgent:
             )
             
             # 初始化LLM客户端
-            self._llm_client = QwenClient(
+            self._llm_client = get_qwen_client(
                 model=self.llm_model,
                 temperature=self.llm_temperature
             )
             
-            # 初始化MCP客户端
-            self._mcp_client = MultiServerMCPClient({
-                "xiaohongshu": {
-                    "url": self.mcp_url,
-                    "transport": self.mcp_transport,
-                }
-            })
-            
-            # 获取MCP工具
-            self.logger.info("Fetching MCP tools...")
-            self._tools = await self._mcp_client.get_tools()
+            # 获取MCP客户端和工具（同一服务地址共享，不重复建立连接和拉取工具列表）
+            self._mcp_client, self._tools = await _get_mcp_tools(
+                self.mcp_url, self.mcp_transport
+            )
             self.logger.info(
                 "MCP tools fetched",
                 tool_count=len(self._tools),
                 tool_names=[tool.name for tool in self._tools]
             )
+            self._capability_tools = _index_tools_by_capability(self._tools)
             
             # 创建Agent（使用新的LangChain 1.0+ API）
             self.logger.info("Creating Agent with LangChain 1.0+ API...")
             # 直接传递模型对象，因为Qwen使用自定义端点
             self._agent = create_agent(
-                model=self._llm_client.client,  # 传递模型对象
+                model=await self._llm_client.aget_client(),  # 传递模型对象
                 tools=self._tools,
                 system_prompt="你是一个专业的小红书内容运营助手，可以帮助用户发布内容、查看数据、进行互动等操作。"
             )
@@ -258,17 +331,7 @@ class XiaohongshuMCPAgent:
         """检查登录状态（便捷方法）"""
         await self._initialize()
         
-        login_tool = next(
-            (tool for tool in self._tools if "login" in tool.name.lower() and "status" in tool.name.lower()),
-            None
-        )
-        
-        if not login_tool:
-            # 尝试查找其他可能的登录状态工具
-            login_tool = next(
-                (tool for tool in self._tools if "check_login" in tool.name.lower()),
-                None
-            )
+        login_tool = self._capability_tools.get("login_status")
         
         if login_tool:
             result = await login_tool.ainvoke({})
@@ -293,10 +356,7 @@ class XiaohongshuMCPAgent:
         """
         await self._initialize()
         
-        publish_tool = next(
-            (tool for tool in self._tools if "publish_content" in tool.name.lower()),
-            None
-        )
+        publish_tool = self._capability_tools.get("publish_content")
         
         if not publish_tool:
             raise ValueError("publish_content tool not found in MCP tools")
@@ -331,10 +391,7 @@ class XiaohongshuMCPAgent:
         """
         await self._initialize()
         
-        video_tool = next(
-            (tool for tool in self._tools if "publish_with_video" in tool.name.lower() or "video" in tool.name.lower()),
-            None
-        )
+        video_tool = self._capability_tools.get("publish_with_video")
         
         if not video_tool:
             raise ValueError("publish_with_video tool not found in MCP tools")
@@ -351,8 +408,17 @@ class XiaohongshuMCPAgent:
         result = await video_tool.ainvoke(params)
         return result
 
-    async def close(self):
-        """关闭MCP客户端连接"""
+    async def close(self, refresh: bool = False):
+        """关闭MCP客户端连接
+
+        MCP 客户端和工具列表在同一服务地址的 agent 之间共享，默认只释放本实例的引用。
+
+        Args:
+            refresh: 是否同时丢弃共享缓存（如 MCP 服务重启或工具有变化），
+                之后任意 agent 初始化时都会重新拉取工具列表
+        """
+        if refresh:
+            _invalidate_mcp_tools(self.mcp_url, self.mcp_transport)
         if self._mcp_client:
             # MultiServerMCPClient 可能需要清理资源
             # 根据实际API调整
@@ -1,15 +1,55 @@
-"""模型客户端模块"""
+"""模型客户端模块
 
-from .llm.base import BaseLLMClient
-from .llm.qwen_client import QwenClient
-from .llm.deepseek_client import DeepSeekClient
+客户端类按需加载（PEP 562），只使用其中一个客户端时不会导入其他客户端的依赖。
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .http import (
+        aclose_async_http_client,
+        close_http_client,
+        get_async_http_client,
+        get_http_client,
+    )
+    from .llm.base import BaseLLMClient
+    from .llm.deepseek_client import DeepSeekClient
+    from .llm.qwen_client import QwenClient, get_qwen_client
 
 __all__ = [
     "BaseLLMClient",
     "QwenClient",
     "DeepSeekClient",
+    "get_qwen_client",
+    "get_http_client",
+    "close_http_client",
+    "get_async_http_client",
+    "aclose_async_http_client",
 ]
 
+# 导出名称 -> 定义模块
+_LAZY_IMPORTS = {
+    "BaseLLMClient": ".llm.base",
+    "QwenClient": ".llm.qwen_client",
+    "DeepSeekClient": ".llm.deepseek_client",
+    "get_qwen_client": ".llm.qwen_client",
+    "get_http_client": ".http",
+    "close_http_client": ".http",
+    "get_async_http_client": ".http",
+    "aclose_async_http_client": ".http",
+}
+
 
+def __getattr__(name: str) -> Any:
+    """首次访问时导入客户端类，并缓存到模块全局变量中"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
 
 
+def __dir__() -> list:
+    return sorted(set(globals()) | set(__all__))
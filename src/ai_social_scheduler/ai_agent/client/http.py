@@ -0,0 +1,86 @@
+"""共享 HTTP 客户端
+
+同一事件循环内的所有 LLM 客户端共用一个 httpx 连接池，复用 TCP/TLS 连接，
+避免每个客户端实例各自建立连接池和 SSL 上下文。
+连接与创建它的事件循环绑定，因此按事件循环分别缓存；LLM 客户端也按事件循环
+分别创建底层客户端（见 BaseLLMClient.aget_client），连接池关闭后会自动重建。
+同步调用（invoke/stream）共用一个进程级 Client，httpx.Client 本身是线程安全的；
+关闭后再次获取会创建新的 Client，LLM 客户端随之重建底层客户端（见 BaseLLMClient.client）。
+"""
+
+import asyncio
+import threading
+import weakref
+from typing import Optional
+
+import httpx
+
+# 连接池限制
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=20)
+
+# 进程级共享的同步 Client
+_sync_client: Optional[httpx.Client] = None
+_sync_client_lock = threading.Lock()
+
+# 事件循环 -> 共享的 AsyncClient
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.Client:
+    """获取进程共享的同步 Client"""
+    global _sync_client
+    client = _sync_client
+    if client is None or client.is_closed:
+        with _sync_client_lock:
+            client = _sync_client
+            if client is None or client.is_closed:
+                client = _sync_client = httpx.Client(limits=HTTP_LIMITS, follow_redirects=True)
+    return client
+
+
+def close_http_client() -> None:
+    """关闭共享的同步 Client（应用关闭时调用）
+
+    已创建的 LLM 客户端在下次同步调用时会基于新的连接池重新创建底层客户端。
+    """
+    global _sync_client
+    with _sync_client_lock:
+        client, _sync_client = _sync_client, None
+    if client is not None:
+        client.close()
+
+
+def get_async_http_client(
+    loop: Optional[asyncio.AbstractEventLoop] = None,
+) -> Optional[httpx.AsyncClient]:
+    """获取事件循环共享的 AsyncClient
+
+    Args:
+        loop: 事件循环，默认使用当前运行中的事件循环
+
+    Returns:
+        共享的 AsyncClient；不在事件循环中且未指定 loop 时返回 None
+    """
+    if loop is None:
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    client = _async_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(limits=HTTP_LIMITS, follow_redirects=True)
+        _async_clients[loop] = client
+    return client
+
+
+async def aclose_async_http_client() -> None:
+    """关闭当前事件循环共享的 AsyncClient（应用关闭时调用）
+
+    已创建的 LLM 客户端在下次异步调用时会基于新的连接池重新创建底层客户端。
+    """
+    client = _async_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
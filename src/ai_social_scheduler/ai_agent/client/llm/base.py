@@ -1,14 +1,31 @@
 """基础 LLM 客户端"""
 
+import asyncio
+import weakref
 from abc import ABC, abstractmethod
 from typing import Any, AsyncIterator, List, Optional
 
+import httpx
 from langchain_core.messages import BaseMessage
 
+from ..http import get_async_http_client, get_http_client
+
 
 class BaseLLMClient(ABC):
     """基础 LLM 客户端抽象类"""
 
+    __slots__ = (
+        "model",
+        "temperature",
+        "max_tokens",
+        "timeout",
+        "extra_params",
+        "_client",
+        "_client_pool",
+        "_async_clients",
+        "_shared",
+    )
+
     def __init__(
         self,
         model: str,
@@ -33,19 +50,58 @@ class BaseLLMClient(ABC):
         self.timeout = timeout
         self.extra_params = kwargs
         self._client = None
+        # 同步客户端创建时使用的共享连接池
+        self._client_pool: Optional[httpx.Client] = None
+        # 事件循环 -> (创建时使用的共享连接池, 底层客户端)
+        self._async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, tuple]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # 由缓存工厂（如 get_qwen_client）返回的共享实例不允许修改配置
+        self._shared = False
 
     @abstractmethod
-    def _create_client(self):
-        """创建底层客户端（由子类实现）"""
+    def _create_client(
+        self,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """创建底层客户端（由子类实现）
+
+        Args:
+            http_client: 同步请求使用的共享连接池，为 None 时由底层客户端自行创建
+            http_async_client: 异步请求使用的共享连接池，为 None 时由底层客户端自行创建
+        """
         pass
 
     @property
     def client(self):
-        """获取客户端实例（懒加载）"""
-        if self._client is None:
-            self._client = self._create_client()
+        """获取同步调用使用的客户端实例（懒加载）
+
+        共享连接池被关闭或替换后会重新创建。
+        """
+        http_client = get_http_client()
+        if self._client is None or self._client_pool is not http_client:
+            self._client = self._create_client(http_client=http_client)
+            self._client_pool = http_client
         return self._client
 
+    async def aget_client(self):
+        """异步获取客户端实例（懒加载）
+
+        异步连接池与事件循环绑定，因此按事件循环分别创建底层客户端；
+        共享连接池被关闭或替换后会重新创建。创建底层客户端（初始化 SSL 上下文等
+        同步操作）在线程池中执行，避免阻塞事件循环。
+        """
+        loop = asyncio.get_running_loop()
+        http_async_client = get_async_http_client(loop)
+        cached = self._async_clients.get(loop)
+        if cached is None or cached[0] is not http_async_client:
+            client = await asyncio.to_thread(
+                self._create_client, http_async_client=http_async_client
+            )
+            cached = self._async_clients[loop] = (http_async_client, client)
+        return cached[1]
+
     @abstractmethod
     async def generate(
         self,
@@ -82,6 +138,69 @@ class BaseLLMClient(ABC):
         """
         pass
 
+    async def generate_stream_batched(
+        self,
+        messages: List[BaseMessage],
+        max_chunks: int = 8,
+        max_delay: float = 0.02,
+        **kwargs,
+    ) -> AsyncIterator[str]:
+        """
+        流式生成文本（合并输出）
+
+        将连续的小文本块合并后再输出：累计 max_chunks 个块，或缓冲中最早的块
+        已等待 max_delay 秒时输出一次，减少下游（如 HTTP 流式响应）的逐块开销。
+        上游停顿时也会按时输出已缓冲的内容，不会等到下一个块到达。
+
+        Args:
+            messages: 消息列表
+            max_chunks: 每次输出最多合并的文本块数
+            max_delay: 文本块在缓冲中的最长等待时间（秒）
+            **kwargs: 其他参数
+
+        Yields:
+            合并后的文本块
+        """
+        loop = asyncio.get_running_loop()
+        stream = self.generate_stream(messages, **kwargs).__aiter__()
+        buffer: List[str] = []
+        deadline: Optional[float] = None
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                if pending is None:
+                    pending = asyncio.ensure_future(stream.__anext__())
+                timeout = None if deadline is None else max(deadline - loop.time(), 0)
+                # 用 asyncio.wait 而不是 wait_for：超时后继续等待同一个块，不取消上游
+                done, _ = await asyncio.wait((pending,), timeout=timeout)
+                if not done:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    deadline = None
+                    continue
+
+                task, pending = pending, None
+                try:
+                    chunk = task.result()
+                except StopAsyncIteration:
+                    break
+                buffer.append(chunk)
+                if deadline is None:
+                    deadline = loop.time() + max_delay
+                if len(buffer) >= max_chunks or loop.time() >= deadline:
+                    yield "".join(buffer)
+                    buffer.clear()
+                    deadline = None
+
+            if buffer:
+                yield "".join(buffer)
+        finally:
+            if pending is not None:
+                pending.cancel()
+                await asyncio.gather(pending, return_exceptions=True)
+            if hasattr(stream, "aclose"):
+                await stream.aclose()
+
     def update_config(
         self,
         model: Optional[str] = None,
@@ -99,7 +218,14 @@ class BaseLLMClient(ABC):
             max_tokens: 最大 token 数
             timeout: 超时时间
             **kwargs: 其他参数
+
+        Raises:
+            RuntimeError: 实例由缓存工厂共享时（修改会影响其他持有者）
         """
+        if self._shared:
+            raise RuntimeError(
+                f"{type(self).__name__} 是共享实例，不能修改配置；请使用新的参数获取客户端"
+            )
         if model is not None:
             self.model = model
         if temperature is not None:
@@ -112,6 +238,7 @@ class BaseLLMClient(ABC):
             self.extra_params.update(kwargs)
         # 重置客户端以应用新配置
         self._client = None
+        self._async_clients.clear()
 
 
 
@@ -2,8 +2,8 @@
 
 from typing import AsyncIterator, List, Optional
 
+import httpx
 from langchain_core.messages import BaseMessage
-from langchain_openai import ChatOpenAI
 
 from ....config import model_config
 from ...tools.logging import get_logger
@@ -15,6 +15,8 @@ logger = get_logger(__name__)
 class DeepSeekClient(BaseLLMClient):
     """DeepSeek 客户端"""
 
+    __slots__ = ("api_key", "endpoint")
+
     def __init__(
         self,
         model: Optional[str] = None,
@@ -64,8 +66,22 @@ class DeepSeekClient(BaseLLMClient):
         self.api_key = default_api_key
         self.endpoint = default_endpoint
 
-    def _create_client(self):
-        """创建 LangChain ChatOpenAI 客户端"""
+    def _create_client(
+        self,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """创建 LangChain ChatOpenAI 客户端（使用共享 HTTP 连接池）"""
+        # langchain_openai 导入较重，只在首次创建客户端时加载
+        from langchain_openai import ChatOpenAI
+
+        # 同步/异步请求都使用共享连接池（extra_params 中显式传入时以其为准）
+        params = {
+            "http_client": http_client,
+            "http_async_client": http_async_client,
+            **self.extra_params,
+        }
+
         return ChatOpenAI(
             model=self.model,
             openai_api_key=self.api_key,
@@ -73,7 +89,7 @@ class DeepSeekClient(BaseLLMClient):
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             timeout=self.timeout,
-            **self.extra_params,
+            **params,
         )
 
     async def generate(
@@ -83,7 +99,7 @@ class DeepSeekClient(BaseLLMClient):
     ) -> str:
         """生成文本"""
         try:
-            client = self.client
+            client = await self.aget_client()
             response = await client.ainvoke(messages, **kwargs)
             return response.content
         except Exception as e:
@@ -97,7 +113,7 @@ class DeepSeekClient(BaseLLMClient):
     ) -> AsyncIterator[str]:
         """流式生成文本"""
         try:
-            client = self.client
+            client = await self.aget_client()
             async for chunk in client.astream(messages, **kwargs):
                 if chunk.content:
                     yield chunk.content
@@ -1,9 +1,10 @@
 """阿里百炼（通义千问）客户端"""
 
+from functools import lru_cache
 from typing import AsyncIterator, List, Optional
 
+import httpx
 from langchain_core.messages import BaseMessage
-from langchain_openai import ChatOpenAI
 
 from ....config import model_config
 from ...tools.logging import get_logger
@@ -15,6 +16,8 @@ logger = get_logger(__name__)
 class QwenClient(BaseLLMClient):
     """阿里百炼（通义千问）客户端"""
 
+    __slots__ = ("api_key", "endpoint")
+
     def __init__(
         self,
         model: Optional[str] = None,
@@ -68,13 +71,27 @@ class QwenClient(BaseLLMClient):
         self.api_key = default_api_key
         self.endpoint = default_endpoint
 
-    def _create_client(self):
-        """创建 LangChain ChatOpenAI 客户端"""
+    def _create_client(
+        self,
+        http_client: Optional[httpx.Client] = None,
+        http_async_client: Optional[httpx.AsyncClient] = None,
+    ):
+        """创建 LangChain ChatOpenAI 客户端（使用共享 HTTP 连接池）"""
+        # langchain_openai 导入较重，只在首次创建客户端时加载
+        from langchain_openai import ChatOpenAI
+
         # 处理 API Key 格式（如果需要）
         api_key = self.api_key
         if not api_key.startswith("sk-"):
             api_key = f"sk-{api_key}"
 
+        # 同步/异步请求都使用共享连接池（extra_params 中显式传入时以其为准）
+        params = {
+            "http_client": http_client,
+            "http_async_client": http_async_client,
+            **self.extra_params,
+        }
+
         return ChatOpenAI(
             model=self.model,
             openai_api_key=api_key,
@@ -82,7 +99,7 @@ class QwenClient(BaseLLMClient):
             temperature=self.temperature,
             max_tokens=self.max_tokens,
             timeout=self.timeout,
-            **self.extra_params,
+            **params,
         )
 
     async def generate(
@@ -92,7 +109,7 @@ class QwenClient(BaseLLMClient):
     ) -> str:
         """生成文本"""
         try:
-            client = self.client
+            client = await self.aget_client()
             response = await client.ainvoke(messages, **kwargs)
             return response.content
         except Exception as e:
@@ -106,7 +123,7 @@ class QwenClient(BaseLLMClient):
     ) -> AsyncIterator[str]:
         """流式生成文本"""
         try:
-            client = self.client
+            client = await self.aget_client()
             async for chunk in client.astream(messages, **kwargs):
                 if chunk.content:
                     yield chunk.content
@@ -143,3 +160,21 @@ class QwenClient(BaseLLMClient):
             logger.error("通义千问流式生成失败", model=self.model, error=str(e))
             raise
 
+
+@lru_cache(maxsize=8)
+def get_qwen_client(
+    model: Optional[str] = None,
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+) -> QwenClient:
+    """获取共享的通义千问客户端
+
+    按 (model, temperature, max_tokens) 缓存实例，相同参数的调用方复用同一个
+    客户端及其底层 ChatOpenAI，避免重复读取配置和创建客户端。
+
+    返回的实例是共享的，调用 update_config 会抛出 RuntimeError，
+    需要不同参数时应传入不同的参数获取新实例。
+    """
+    client = QwenClient(model=model, temperature=temperature, max_tokens=max_tokens)
+    client._shared = True
+    return client
@@ -1,22 +1,31 @@
 """主工作流定义"""
 
-from typing import Any, Dict
-
-from langgraph.graph import StateGraph
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict
 
 from .state import AgentState
 
+if TYPE_CHECKING:
+    from langgraph.graph import StateGraph
+
 
-def create_workflow() -> StateGraph:
+def create_workflow() -> "StateGraph":
     """创建主工作流图"""
+    from langgraph.graph import StateGraph
+
     # TODO: 实现工作流图构建逻辑
     workflow = StateGraph(AgentState)
     return workflow.compile()
 
 
+@lru_cache(maxsize=1)
+def get_workflow() -> "StateGraph":
+    """获取编译后的主工作流图（只构建一次，后续调用复用）"""
+    return create_workflow()
+
+
 async def run_workflow(initial_state: Dict[str, Any]) -> Dict[str, Any]:
     """运行工作流"""
-    workflow = create_workflow()
+    workflow = get_workflow()
     result = await workflow.ainvoke(initial_state)
     return result
-
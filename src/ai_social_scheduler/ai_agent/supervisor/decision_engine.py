@@ -5,7 +5,7 @@ from typing import Any, Dict, List, Optional
 from langchain_core.messages import HumanMessage
 from langchain_core.runnables import RunnableConfig
 
-from ..client import QwenClient
+from ..client import get_qwen_client
 from ..tools.logging import get_logger
 
 logger = get_logger(__name__)
@@ -23,7 +23,7 @@ class DecisionEngine:
 
     def __init__(self, model: str = "qwen-plus", temperature: float = 0.7):
         """初始化决策引擎"""
-        self.client = QwenClient(model=model, temperature=temperature)
+        self.client = get_qwen_client(model=model, temperature=temperature)
         self.logger = logger
 
     async def understand_request(self, request: str, context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
@@ -54,7 +54,8 @@ class DecisionEngine:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "intent": "content_publish",
@@ -90,7 +91,8 @@ class DecisionEngine:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "sentiment": "positive",
@@ -124,7 +126,8 @@ class DecisionEngine:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "relevance": 0.8,
@@ -159,7 +162,8 @@ class DecisionEngine:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "cause": "unknown",
@@ -195,7 +199,8 @@ class DecisionEngine:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "decision": options[0] if options else None,
@@ -1,6 +1,8 @@
 """状态管理器 - 负责全局状态管理"""
 
-from typing import Any, Dict, List, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from datetime import datetime
 
 from ..tools.logging import get_logger
@@ -8,6 +10,54 @@ from ..tools.logging import get_logger
 logger = get_logger(__name__)
 
 
+class _TTLStateStore:
+    """带过期时间和容量上限的状态存储
+
+    按最近写入顺序保存记录：写入时移到末尾，过期或超出容量的记录从头部淘汰，
+    长时间运行时内存占用有上界。
+    """
+
+    __slots__ = ("maxsize", "ttl", "_clock", "_data")
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._data: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        item = self._data.get(key)
+        if item is None:
+            return None
+        expires_at, value = item
+        if expires_at <= self._clock():
+            del self._data[key]
+            return None
+        return value
+
+    def __setitem__(self, key: str, value: Dict[str, Any]) -> None:
+        now = self._clock()
+        self._data[key] = (now + self.ttl, value)
+        self._data.move_to_end(key)
+        self._evict(now)
+
+    def touch(self, key: str) -> None:
+        """刷新记录的过期时间"""
+        if key in self._data:
+            self[key] = self._data[key][1]
+
+    def _evict(self, now: float) -> None:
+        data = self._data
+        while data:
+            expires_at, _ = next(iter(data.values()))
+            if expires_at > now and len(data) <= self.maxsize:
+                break
+            data.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
 class StateManager:
     """状态管理器
     
@@ -18,11 +68,23 @@ class StateManager:
     - 状态查询
     """
 
-    def __init__(self):
-        """初始化状态管理器"""
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600, max_steps: int = 256):
+        """初始化状态管理器
+
+        Args:
+            maxsize: 最多保留的工作流状态数
+            ttl: 工作流状态在最后一次写入后的保留时间（秒）
+            max_steps: 每个工作流最多保留的步骤记录数（超出时丢弃最早的记录），为 0 时不保留
+
+        Raises:
+            ValueError: max_steps 为负数
+        """
+        if max_steps < 0:
+            raise ValueError(f"max_steps must be >= 0, got {max_steps}")
         self.logger = logger
+        self.max_steps = max_steps
         # TODO: 使用数据库或缓存存储状态
-        self.state_store: Dict[str, Any] = {}
+        self.state_store = _TTLStateStore(maxsize=maxsize, ttl=ttl)
 
     async def record_execution_result(
         self,
@@ -42,8 +104,9 @@ class StateManager:
         Returns:
             是否成功
         """
-        if workflow_id not in self.state_store:
-            self.state_store[workflow_id] = {
+        record = self.state_store.get(workflow_id)
+        if record is None:
+            record = self.state_store[workflow_id] = {
                 "workflow_id": workflow_id,
                 "created_at": datetime.now().isoformat(),
                 "steps": [],
@@ -57,8 +120,12 @@ class StateManager:
             "timestamp": datetime.now().isoformat(),
         }
         
-        self.state_store[workflow_id]["steps"].append(step_record)
-        self.state_store[workflow_id]["status"] = status
+        steps = record["steps"]
+        steps.append(step_record)
+        if len(steps) > self.max_steps:
+            del steps[: len(steps) - self.max_steps]
+        record["status"] = status
+        self.state_store.touch(workflow_id)
         
         self.logger.info(
             "Execution result recorded",
@@ -182,14 +249,16 @@ class StateManager:
         Returns:
             是否成功
         """
-        if workflow_id not in self.state_store:
-            self.state_store[workflow_id] = {
+        record = self.state_store.get(workflow_id)
+        if record is None:
+            record = self.state_store[workflow_id] = {
                 "workflow_id": workflow_id,
                 "created_at": datetime.now().isoformat(),
             }
         
-        self.state_store[workflow_id].update(updates)
-        self.state_store[workflow_id]["updated_at"] = datetime.now().isoformat()
+        record.update(updates)
+        record["updated_at"] = datetime.now().isoformat()
+        self.state_store.touch(workflow_id)
         
         return True
 
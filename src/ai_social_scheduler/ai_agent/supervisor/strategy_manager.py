@@ -4,7 +4,7 @@ from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import HumanMessage
 
-from ..client import QwenClient
+from ..client import get_qwen_client
 from ..tools.logging import get_logger
 
 logger = get_logger(__name__)
@@ -22,7 +22,7 @@ class StrategyManager:
 
     def __init__(self, model: str = "qwen-plus", temperature: float = 0.7):
         """初始化策略管理器"""
-        self.client = QwenClient(model=model, temperature=temperature)
+        self.client = get_qwen_client(model=model, temperature=temperature)
         self.logger = logger
         # TODO: 从数据库加载策略库
         self.strategy_library: Dict[str, Any] = {}
@@ -60,7 +60,8 @@ class StrategyManager:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "topic": "default_topic",
@@ -93,7 +94,8 @@ class StrategyManager:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "topic": "selected_topic",
@@ -122,7 +124,8 @@ class StrategyManager:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "strategy": "matched_strategy",
@@ -151,7 +154,8 @@ class StrategyManager:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "optimized_strategy": "new_strategy",
@@ -201,7 +205,8 @@ class StrategyManager:
         返回 JSON 格式。
         """
         
-        response = await self.client.client.ainvoke([HumanMessage(content=prompt)])
+        client = await self.client.aget_client()
+        response = await client.ainvoke([HumanMessage(content=prompt)])
         # TODO: 解析响应，返回结构化结果
         return {
             "patterns": ["模式1", "模式2"],
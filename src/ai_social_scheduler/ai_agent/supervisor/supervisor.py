@@ -3,16 +3,37 @@
 from typing import Any, Dict, List, Optional
 
 from langchain_core.messages import HumanMessage
-from langgraph_supervisor import create_supervisor
 
 from .decision_engine import DecisionEngine
 from .strategy_manager import StrategyManager
 from .state_manager import StateManager
-from ..prompts import SUPERVISOR_PROMPT
+from ..prompts import (
+    SUPERVISOR_PROMPT,
+    CONTENT_PUBLISH_SUPERVISOR_PROMPT,
+    AUTO_REPLY_SUPERVISOR_PROMPT,
+    SCHEDULED_PUBLISH_SUPERVISOR_PROMPT,
+    HOT_TOPIC_TRACKING_SUPERVISOR_PROMPT,
+    EXCEPTION_HANDLING_SUPERVISOR_PROMPT,
+    COMPETITOR_ANALYSIS_SUPERVISOR_PROMPT,
+    MESSAGE_HANDLING_SUPERVISOR_PROMPT,
+    PERFORMANCE_ANALYSIS_SUPERVISOR_PROMPT,
+)
 from ..tools.logging import get_logger
 
 logger = get_logger(__name__)
 
+# 工作流名称 -> Supervisor 提示词
+_WORKFLOW_PROMPTS: Dict[str, str] = {
+    "content_publish": CONTENT_PUBLISH_SUPERVISOR_PROMPT,
+    "auto_reply": AUTO_REPLY_SUPERVISOR_PROMPT,
+    "scheduled_publish": SCHEDULED_PUBLISH_SUPERVISOR_PROMPT,
+    "hot_topic_tracking": HOT_TOPIC_TRACKING_SUPERVISOR_PROMPT,
+    "exception_handling": EXCEPTION_HANDLING_SUPERVISOR_PROMPT,
+    "competitor_analysis": COMPETITOR_ANALYSIS_SUPERVISOR_PROMPT,
+    "message_handling": MESSAGE_HANDLING_SUPERVISOR_PROMPT,
+    "performance_analysis": PERFORMANCE_ANALYSIS_SUPERVISOR_PROMPT,
+}
+
 
 class Supervisor:
     """Supervisor - 中央协调者
@@ -57,31 +78,11 @@ class Supervisor:
         Args:
             workflow_name: 工作流名称，用于选择对应的提示词
         """
-        from ..prompts.supervisor import (
-            CONTENT_PUBLISH_SUPERVISOR_PROMPT,
-            AUTO_REPLY_SUPERVISOR_PROMPT,
-            SCHEDULED_PUBLISH_SUPERVISOR_PROMPT,
-            HOT_TOPIC_TRACKING_SUPERVISOR_PROMPT,
-            EXCEPTION_HANDLING_SUPERVISOR_PROMPT,
-            COMPETITOR_ANALYSIS_SUPERVISOR_PROMPT,
-            MESSAGE_HANDLING_SUPERVISOR_PROMPT,
-            PERFORMANCE_ANALYSIS_SUPERVISOR_PROMPT,
-        )
-        
-        # 根据工作流选择对应的提示词
-        workflow_prompts = {
-            "content_publish": CONTENT_PUBLISH_SUPERVISOR_PROMPT,
-            "auto_reply": AUTO_REPLY_SUPERVISOR_PROMPT,
-            "scheduled_publish": SCHEDULED_PUBLISH_SUPERVISOR_PROMPT,
-            "hot_topic_tracking": HOT_TOPIC_TRACKING_SUPERVISOR_PROMPT,
-            "exception_handling": EXCEPTION_HANDLING_SUPERVISOR_PROMPT,
-            "competitor_analysis": COMPETITOR_ANALYSIS_SUPERVISOR_PROMPT,
-            "message_handling": MESSAGE_HANDLING_SUPERVISOR_PROMPT,
-            "performance_analysis": PERFORMANCE_ANALYSIS_SUPERVISOR_PROMPT,
-        }
-        
-        # 选择提示词，如果没有匹配的则使用通用提示词
-        base_prompt = workflow_prompts.get(workflow_name, SUPERVISOR_PROMPT)
+        # langgraph_supervisor 只在首次构建 Supervisor 图时导入
+        from langgraph_supervisor import create_supervisor
+
+        # 根据工作流选择对应的提示词，如果没有匹配的则使用通用提示词
+        base_prompt = _WORKFLOW_PROMPTS.get(workflow_name, SUPERVISOR_PROMPT)
         
         agent_list = "\n".join([f"- {agent.name}" for agent in self.agents])
         prompt = base_prompt.format(agent_list=agent_list)
@@ -175,7 +176,7 @@ class Supervisor:
             
             raise
 
-    def get_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
+    async def get_state(self, workflow_id: str) -> Optional[Dict[str, Any]]:
         """获取工作流状态
         
         Args:
@@ -184,5 +185,5 @@ class Supervisor:
         Returns:
             状态数据
         """
-        return self.state_manager.get_state(workflow_id)
+        return await self.state_manager.get_state(workflow_id)
 
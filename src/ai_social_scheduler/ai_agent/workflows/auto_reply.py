@@ -18,6 +18,8 @@ class AutoReplyWorkflow(BaseWorkflow):
     6. 状态管理器更新互动记录
     """
 
+    required_fields = frozenset({"comment"})
+
     def __init__(self, supervisor: Supervisor):
         """初始化工作流"""
         super().__init__(
@@ -55,9 +57,3 @@ class AutoReplyWorkflow(BaseWorkflow):
             
         except Exception as e:
             return await self.handle_error(e, "execute")
-
-    def validate_input(self, input_data: Dict[str, Any]) -> bool:
-        """验证输入数据"""
-        required_fields = ["comment"]
-        return all(field in input_data for field in required_fields)
-
@@ -1,7 +1,7 @@
 """工作流基类"""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from ..tools.logging import get_logger
 
@@ -14,6 +14,9 @@ class BaseWorkflow(ABC):
     所有工作流都应该继承这个基类，实现统一的接口。
     """
 
+    # 输入数据必须包含的字段（子类按需覆盖）
+    required_fields: FrozenSet[str] = frozenset()
+
     def __init__(self, name: str, description: str):
         """初始化工作流
         
@@ -55,9 +58,9 @@ class BaseWorkflow(ABC):
         Returns:
             是否有效
         """
-        # 默认实现：总是返回 True
-        # 子类可以重写此方法进行输入验证
-        return True
+        # 默认实现：检查 required_fields 是否都存在
+        # 子类可以重写此方法进行更复杂的输入验证
+        return input_data.keys() >= self.required_fields
 
     async def handle_error(self, error: Exception, step: str) -> Dict[str, Any]:
         """处理错误
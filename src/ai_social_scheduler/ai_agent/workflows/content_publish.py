@@ -19,6 +19,8 @@ class ContentPublishWorkflow(BaseWorkflow):
     7. 返回结果给用户
     """
 
+    required_fields = frozenset({"user_request"})
+
     def __init__(self, supervisor: Supervisor):
         """初始化工作流"""
         super().__init__(
@@ -65,9 +67,3 @@ class ContentPublishWorkflow(BaseWorkflow):
             
         except Exception as e:
             return await self.handle_error(e, "execute")
-
-    def validate_input(self, input_data: Dict[str, Any]) -> bool:
-        """验证输入数据"""
-        required_fields = ["user_request"]
-        return all(field in input_data for field in required_fields)
-
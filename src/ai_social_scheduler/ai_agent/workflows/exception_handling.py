@@ -20,6 +20,8 @@ class ExceptionHandlingWorkflow(BaseWorkflow):
     8. 通知用户（如需要）
     """
 
+    required_fields = frozenset({"exception_data"})
+
     def __init__(self, supervisor: Supervisor):
         """初始化工作流"""
         super().__init__(
@@ -60,9 +62,3 @@ class ExceptionHandlingWorkflow(BaseWorkflow):
             
         except Exception as e:
             return await self.handle_error(e, "execute")
-
-    def validate_input(self, input_data: Dict[str, Any]) -> bool:
-        """验证输入数据"""
-        required_fields = ["exception_data"]
-        return all(field in input_data for field in required_fields)
-
@@ -20,6 +20,8 @@ class MessageHandlingWorkflow(BaseWorkflow):
     8. 标记需人工处理的私信（如需要）
     """
 
+    required_fields = frozenset({"message"})
+
     def __init__(self, supervisor: Supervisor):
         """初始化工作流"""
         super().__init__(
@@ -59,9 +61,3 @@ class MessageHandlingWorkflow(BaseWorkflow):
             
         except Exception as e:
             return await self.handle_error(e, "execute")
-
-    def validate_input(self, input_data: Dict[str, Any]) -> bool:
-        """验证输入数据"""
-        required_fields = ["message"]
-        return all(field in input_data for field in required_fields)
-
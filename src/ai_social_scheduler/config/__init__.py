@@ -1,5 +1,6 @@
 """配置模块"""
 
+# config 模块导入时统一加载 .env，需先于 model_config / mcp_config 导入
 from .config import Settings, settings
 from .model_config import ModelConfig, model_config
 from .mcp_config import MCPConfig, mcp_config
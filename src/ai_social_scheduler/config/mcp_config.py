@@ -1,15 +1,9 @@
 """MCP服务配置管理"""
 
-from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# 加载 .env 文件
-env_path = Path(__file__).parent.parent.parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
-
 
 class MCPConfig(BaseSettings):
     """MCP服务配置"""
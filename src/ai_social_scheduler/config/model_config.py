@@ -1,16 +1,10 @@
 """模型配置"""
 
-from pathlib import Path
 from typing import Optional
 
-from dotenv import load_dotenv
 from pydantic import BaseModel, Field, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-# 加载 .env 文件
-env_path = Path(__file__).parent.parent.parent.parent.parent / ".env"
-load_dotenv(dotenv_path=env_path)
-
 
 class AlibabaBailianConfig(BaseModel):
     """阿里百炼模型配置"""
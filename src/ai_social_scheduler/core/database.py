@@ -0,0 +1,74 @@
+"""数据库连接管理"""
+
+import asyncio
+from functools import lru_cache
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from ..config import settings
+
+
+def _async_database_url(url: str) -> str:
+    """确保数据库 URL 使用 asyncpg 驱动（兼容 postgres:// 简写）"""
+    for scheme in ("postgresql://", "postgres://"):
+        if url.startswith(scheme):
+            return "postgresql+asyncpg://" + url[len(scheme):]
+    return url
+
+
+@lru_cache(maxsize=1)
+def get_engine() -> AsyncEngine:
+    """获取全局异步引擎
+
+    首次调用时才创建引擎（并加载数据库驱动），导入本模块不会触发；
+    连接在首次使用时建立。
+    """
+    return create_async_engine(
+        _async_database_url(settings.database_url),
+        echo=settings.database_echo,
+        poolclass=AsyncAdaptedQueuePool,
+        pool_size=settings.database_pool_size,
+        max_overflow=settings.database_max_overflow,
+        pool_pre_ping=True,
+    )
+
+
+@lru_cache(maxsize=1)
+def get_session_factory() -> async_sessionmaker[AsyncSession]:
+    """获取全局会话工厂（所有会话共用同一个连接池）"""
+    return async_sessionmaker(get_engine(), expire_on_commit=False)
+
+
+async def warm_up_pool(connections: Optional[int] = None) -> None:
+    """预热连接池
+
+    并发建立 ``connections`` 个连接（默认等于连接池大小）后归还到池中，
+    避免首批请求承担建连开销。
+
+    Args:
+        connections: 预先建立的连接数，为 0 时不预热
+    """
+    count = settings.database_pool_size if connections is None else connections
+    engine = get_engine()
+
+    async def _open_connection() -> None:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_open_connection() for _ in range(count)))
+
+
+async def close_database() -> None:
+    """关闭连接池
+
+    只在引擎已创建时释放连接；之后再调用 get_engine() 会创建新的引擎。
+    """
+    if get_engine.cache_info().currsize == 0:
+        return
+    engine = get_engine()
+    get_session_factory.cache_clear()
+    get_engine.cache_clear()
+    await engine.dispose()
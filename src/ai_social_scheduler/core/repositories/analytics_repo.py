@@ -1,8 +1,11 @@
 """分析仓储"""
 
+import base64
 from typing import List, Optional
 from datetime import datetime
 
+import orjson
+
 from .base import BaseRepository
 from ..models.analytics import AnalyticsMetrics, AnalyticsReport
 
@@ -30,11 +33,21 @@ class AnalyticsRepository(BaseRepository):
         # TODO: 实现删除逻辑
         return False
 
-    async def list(self, filters: Optional[dict] = None, limit: int = 100, offset: int = 0) -> List[AnalyticsMetrics]:
+    async def list(self, filters: Optional[dict] = None, limit: int = 100, cursor: Optional[str] = None) -> List[AnalyticsMetrics]:
         """列出分析指标"""
         # TODO: 实现列表逻辑
         return []
 
+    def cursor_for(self, record: AnalyticsMetrics) -> str:
+        """生成分页游标（排序键：(date, content_id)，指标没有独立 id）
+
+        游标为 JSON 数组 [date, content_id] 的 base64url 编码，可无歧义地还原排序键。
+        """
+        if record.date is None:
+            raise ValueError("cannot build a cursor for a metrics record without date")
+        keyset = orjson.dumps([record.date.isoformat(), record.content_id])
+        return base64.urlsafe_b64encode(keyset).decode("ascii")
+
     async def get_report(self, start_date: datetime, end_date: datetime) -> Optional[AnalyticsReport]:
         """获取分析报告"""
         # TODO: 实现报告生成逻辑
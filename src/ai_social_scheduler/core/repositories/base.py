@@ -3,10 +3,22 @@
 from abc import ABC, abstractmethod
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from ..database import get_session_factory
+
 
 class BaseRepository(ABC):
     """基础仓储类"""
 
+    def __init__(self, session_factory: Optional[async_sessionmaker[AsyncSession]] = None):
+        """初始化仓储
+
+        Args:
+            session_factory: 会话工厂，默认使用全局共享的会话工厂（共用同一个连接池）
+        """
+        self.session_factory = session_factory or get_session_factory()
+
     @abstractmethod
     async def create(self, data: Dict[str, Any]) -> Any:
         """创建记录"""
@@ -28,7 +40,26 @@ class BaseRepository(ABC):
         pass
 
     @abstractmethod
-    async def list(self, filters: Optional[Dict[str, Any]] = None, limit: int = 100, offset: int = 0) -> List[Any]:
-        """列出记录"""
+    async def list(self, filters: Optional[Dict[str, Any]] = None, limit: int = 100, cursor: Optional[str] = None) -> List[Any]:
+        """列出记录
+
+        使用游标（keyset）分页：按各仓储自己的排序键升序返回 cursor 之后的记录，
+        最多 limit 条，深分页不会随页数线性变慢。cursor 是不透明字符串，
+        由 cursor_for() 根据上一页最后一条记录生成，调用方不应解析其内容。
+
+        Args:
+            filters: 过滤条件
+            limit: 最大返回条数
+            cursor: 上一页的游标，为 None 时从头开始
+        """
+        pass
+
+    @abstractmethod
+    def cursor_for(self, record: Any) -> str:
+        """根据记录生成指向其之后位置的分页游标（编码该仓储的排序键）
+
+        Raises:
+            ValueError: 记录缺少排序键（如尚未保存）
+        """
         pass
 
@@ -29,8 +29,13 @@ class ContentRepository(BaseRepository):
         # TODO: 实现删除逻辑
         return False
 
-    async def list(self, filters: Optional[dict] = None, limit: int = 100, offset: int = 0) -> List[Content]:
+    async def list(self, filters: Optional[dict] = None, limit: int = 100, cursor: Optional[str] = None) -> List[Content]:
         """列出内容"""
         # TODO: 实现列表逻辑
         return []
 
+    def cursor_for(self, record: Content) -> str:
+        """生成分页游标（排序键：id）"""
+        if record.id is None:
+            raise ValueError("cannot build a cursor for an unsaved record")
+        return record.id
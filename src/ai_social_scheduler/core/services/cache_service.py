@@ -1,8 +1,8 @@
 """缓存服务"""
 
 from typing import Any, Optional
-import json
 
+import orjson
 import redis.asyncio as redis
 
 from ..config import settings
@@ -33,7 +33,7 @@ class CacheService:
             client = await self._get_client()
             value = await client.get(key)
             if value:
-                return json.loads(value)
+                return orjson.loads(value)
             return None
         except Exception as e:
             logger.error("缓存获取失败", key=key, error=str(e))
@@ -43,7 +43,7 @@ class CacheService:
         """设置缓存"""
         try:
             client = await self._get_client()
-            serialized = json.dumps(value)
+            serialized = orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS)
             if ttl:
                 await client.setex(key, ttl, serialized)
             else:
@@ -0,0 +1,99 @@
+"""ETag 中间件功能测试"""
+
+import pytest
+from starlette.applications import Starlette
+from starlette.responses import JSONResponse, Response, StreamingResponse
+from starlette.routing import Route
+from starlette.testclient import TestClient
+
+from ai_social_scheduler.web.middleware import ETagMiddleware
+
+
+async def json_endpoint(request):
+    return JSONResponse({"items": [1, 2, 3]}, headers={"vary": "Accept-Encoding", "content-location": "/items"})
+
+
+async def cookies_endpoint(request):
+    response = Response("ok")
+    response.set_cookie("x", "1")
+    response.set_cookie("y", "2")
+    return response
+
+
+async def stream_endpoint(request):
+    async def chunks():
+        yield b"a"
+        yield b"b"
+
+    return StreamingResponse(chunks(), media_type="text/plain")
+
+
+@pytest.fixture
+def client():
+    app = Starlette(
+        routes=[
+            Route("/items", json_endpoint),
+            Route("/cookies", cookies_endpoint),
+            Route("/stream", stream_endpoint),
+        ]
+    )
+    app.add_middleware(ETagMiddleware)
+    return TestClient(app)
+
+
+def test_sets_etag_and_default_cache_control(client):
+    """测试 200 响应带 ETag 和默认 Cache-Control，响应体不变"""
+    response = client.get("/items")
+
+    assert response.status_code == 200
+    assert response.json() == {"items": [1, 2, 3]}
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, max-age=0"
+    assert response.headers["content-length"] == str(len(response.content))
+
+
+def test_returns_304_on_revalidation(client):
+    """测试 If-None-Match 命中时返回 304，并保留 Vary/Content-Location"""
+    etag = client.get("/items").headers["etag"]
+
+    response = client.get("/items", headers={"if-none-match": f"W/{etag}"})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["content-location"] == "/items"
+    assert "content-type" not in response.headers
+
+
+def test_keeps_repeated_set_cookie_headers(client):
+    """测试重复出现的 Set-Cookie 响应头不会丢失"""
+    response = client.get("/cookies")
+
+    assert "etag" in response.headers
+    cookies = response.headers.get_list("set-cookie")
+    assert len(cookies) == 2
+    assert any(cookie.startswith("x=1") for cookie in cookies)
+    assert any(cookie.startswith("y=2") for cookie in cookies)
+
+
+def test_keeps_set_cookie_on_304(client):
+    """测试 304 响应保留路由设置的 Set-Cookie"""
+    etag = client.get("/cookies").headers["etag"]
+
+    response = client.get("/cookies", headers={"if-none-match": etag})
+
+    assert response.status_code == 304
+    cookies = response.headers.get_list("set-cookie")
+    assert len(cookies) == 2
+    assert any(cookie.startswith("x=1") for cookie in cookies)
+    assert any(cookie.startswith("y=2") for cookie in cookies)
+
+
+def test_streaming_response_passes_through(client):
+    """测试流式响应（无 Content-Length）不计算 ETag"""
+    response = client.get("/stream")
+
+    assert response.status_code == 200
+    assert response.content == b"ab"
+    assert "etag" not in response.headers
@@ -0,0 +1,140 @@
+"""LLM 客户端基类功能测试"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+
+import pytest
+from ai_social_scheduler.ai_agent.client.http import aclose_async_http_client, close_http_client
+from ai_social_scheduler.ai_agent.client.llm.base import BaseLLMClient
+from ai_social_scheduler.ai_agent.client.llm.qwen_client import get_qwen_client
+from ai_social_scheduler.config import model_config
+
+
+class FakeClient(BaseLLMClient):
+    """按预设节奏输出文本块的测试客户端"""
+
+    def __init__(self, chunks, delays=None, **kwargs):
+        super().__init__(model="fake", **kwargs)
+        self.chunks = chunks
+        self.delays = delays or [0] * len(chunks)
+        self.closed = False
+
+    def _create_client(self, http_client=None, http_async_client=None):
+        return SimpleNamespace(http_client=http_client, http_async_client=http_async_client)
+
+    async def generate(self, messages, **kwargs):
+        return "".join(self.chunks)
+
+    async def generate_stream(self, messages, **kwargs):
+        try:
+            for chunk, delay in zip(self.chunks, self.delays):
+                await asyncio.sleep(delay)
+                yield chunk
+        finally:
+            self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_stream_batched_merges_chunks():
+    """测试按 max_chunks 合并文本块，并在结束时输出剩余内容"""
+    client = FakeClient(["a", "b", "c", "d", "e"])
+
+    result = [
+        text async for text in client.generate_stream_batched([], max_chunks=2, max_delay=10)
+    ]
+
+    assert result == ["ab", "cd", "e"]
+
+
+@pytest.mark.asyncio
+async def test_stream_batched_flushes_when_upstream_stalls():
+    """测试上游停顿时按 max_delay 输出已缓冲内容，而不是等到下一个块"""
+    client = FakeClient(["a", "b", "c"], delays=[0, 0, 0.5])
+    start = time.monotonic()
+    received = []
+
+    async for text in client.generate_stream_batched([], max_chunks=8, max_delay=0.02):
+        received.append((text, time.monotonic() - start))
+
+    assert [text for text, _ in received] == ["ab", "c"]
+    assert received[0][1] < 0.3
+
+
+@pytest.mark.asyncio
+async def test_stream_batched_closes_upstream_on_early_exit():
+    """测试调用方提前停止时关闭上游流"""
+    client = FakeClient(["a", "b", "c"], delays=[0, 0.5, 0])
+    stream = client.generate_stream_batched([], max_chunks=8, max_delay=0.02)
+
+    assert await stream.__anext__() == "a"
+    await stream.aclose()
+
+    assert client.closed is True
+
+
+def test_aget_client_per_event_loop():
+    """测试不同事件循环使用各自的底层客户端和连接池"""
+    client = FakeClient([])
+    loops = [asyncio.new_event_loop(), asyncio.new_event_loop()]
+    try:
+        first = loops[0].run_until_complete(client.aget_client())
+        again = loops[0].run_until_complete(client.aget_client())
+        other = loops[1].run_until_complete(client.aget_client())
+
+        assert first is again
+        assert other is not first
+        assert other.http_async_client is not first.http_async_client
+    finally:
+        for loop in loops:
+            loop.run_until_complete(aclose_async_http_client())
+            loop.close()
+
+
+@pytest.mark.asyncio
+async def test_aget_client_rebuilds_after_pool_closed():
+    """测试共享连接池关闭后重新创建底层客户端"""
+    client = FakeClient([])
+    first = await client.aget_client()
+
+    await aclose_async_http_client()
+    second = await client.aget_client()
+
+    assert second is not first
+    assert first.http_async_client.is_closed
+    assert not second.http_async_client.is_closed
+    await aclose_async_http_client()
+
+
+def test_client_rebuilds_after_sync_pool_closed():
+    """测试同步连接池关闭后重新创建底层客户端"""
+    client = FakeClient([])
+    first = client.client
+    assert client.client is first
+
+    close_http_client()
+    second = client.client
+
+    assert second is not first
+    assert first.http_client.is_closed
+    assert not second.http_client.is_closed
+    close_http_client()
+
+
+def test_shared_qwen_client_rejects_update_config(monkeypatch):
+    """测试共享的通义千问客户端不能修改配置，独立实例不受影响"""
+    monkeypatch.setattr(model_config, "alibaba_bailian__api_key", "test-key")
+    get_qwen_client.cache_clear()
+    try:
+        shared = get_qwen_client(model="qwen-plus", temperature=0.3)
+        assert get_qwen_client(model="qwen-plus", temperature=0.3) is shared
+
+        with pytest.raises(RuntimeError):
+            shared.update_config(temperature=0.9)
+        assert shared.temperature == 0.3
+    finally:
+        get_qwen_client.cache_clear()
+
+    client = FakeClient([])
+    client.update_config(temperature=0.9)
+    assert client.temperature == 0.9
@@ -0,0 +1,33 @@
+"""仓储分页游标测试"""
+
+import base64
+from datetime import datetime
+
+import orjson
+import pytest
+from ai_social_scheduler.core.models.analytics import AnalyticsMetrics
+from ai_social_scheduler.core.models.content import Content
+from ai_social_scheduler.core.repositories.analytics_repo import AnalyticsRepository
+from ai_social_scheduler.core.repositories.content_repo import ContentRepository
+
+
+def _repo(cls):
+    return cls(session_factory=object())
+
+
+def test_analytics_cursor_encodes_keyset():
+    """测试分析指标游标可无歧义地还原 (date, content_id)"""
+    date = datetime(2025, 1, 2, 3, 4, 5)
+    record = AnalyticsMetrics(content_id="a|b", date=date)
+
+    cursor = _repo(AnalyticsRepository).cursor_for(record)
+
+    assert orjson.loads(base64.urlsafe_b64decode(cursor)) == [date.isoformat(), "a|b"]
+
+
+def test_cursor_requires_sort_key():
+    """测试缺少排序键的记录无法生成游标"""
+    with pytest.raises(ValueError):
+        _repo(AnalyticsRepository).cursor_for(AnalyticsMetrics(content_id="c1"))
+    with pytest.raises(ValueError):
+        _repo(ContentRepository).cursor_for(Content(title="t", content="c"))
@@ -0,0 +1,104 @@
+"""状态管理器功能测试"""
+
+import pytest
+from ai_social_scheduler.ai_agent.supervisor.state_manager import StateManager, _TTLStateStore
+
+
+class FakeClock:
+    """可手动推进的时钟"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+def test_store_expires_after_ttl(clock):
+    """测试记录在 ttl 后过期"""
+    store = _TTLStateStore(maxsize=10, ttl=60, clock=clock)
+    store["a"] = {"value": 1}
+
+    clock.now += 59
+    assert store.get("a") == {"value": 1}
+
+    clock.now += 1
+    assert store.get("a") is None
+    assert len(store) == 0
+
+
+def test_store_evicts_oldest_when_full(clock):
+    """测试超出 maxsize 时按写入顺序淘汰最早的记录"""
+    store = _TTLStateStore(maxsize=2, ttl=60, clock=clock)
+    store["a"] = {}
+    store["b"] = {}
+    store["a"] = {"rewritten": True}
+    store["c"] = {}
+
+    assert store.get("b") is None
+    assert store.get("a") == {"rewritten": True}
+    assert store.get("c") == {}
+    assert len(store) == 2
+
+
+def test_store_evicts_expired_records_on_write(clock):
+    """测试写入时清理头部已过期的记录"""
+    store = _TTLStateStore(maxsize=10, ttl=60, clock=clock)
+    store["a"] = {}
+    clock.now += 61
+    store["b"] = {}
+
+    assert len(store) == 1
+
+
+def test_store_touch_extends_ttl_and_recency(clock):
+    """测试 touch 刷新过期时间，并把记录移到淘汰顺序末尾"""
+    store = _TTLStateStore(maxsize=2, ttl=60, clock=clock)
+    store["a"] = {}
+    store["b"] = {}
+
+    clock.now += 50
+    store.touch("a")
+    store.touch("missing")
+    clock.now += 20
+
+    assert store.get("a") == {}
+    assert store.get("b") is None
+
+    store["c"] = {}
+    store["d"] = {}
+    assert store.get("a") is None
+    assert "missing" not in store._data
+
+
+@pytest.mark.asyncio
+async def test_state_manager_caps_steps():
+    """测试每个工作流只保留最近 max_steps 条步骤记录"""
+    manager = StateManager(max_steps=3)
+
+    for index in range(5):
+        await manager.record_execution_result("wf", f"step{index}", {})
+
+    state = await manager.get_state("wf")
+    assert [step["step"] for step in state["steps"]] == ["step2", "step3", "step4"]
+
+
+@pytest.mark.asyncio
+async def test_state_manager_zero_max_steps_keeps_no_steps():
+    """测试 max_steps=0 时不保留步骤记录，负数参数被拒绝"""
+    manager = StateManager(max_steps=0)
+
+    for index in range(5):
+        await manager.record_execution_result("wf", f"step{index}", {})
+
+    state = await manager.get_state("wf")
+    assert state["steps"] == []
+    assert state["status"] == "success"
+
+    with pytest.raises(ValueError):
+        StateManager(max_steps=-1)
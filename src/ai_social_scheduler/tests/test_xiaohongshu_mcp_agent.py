@@ -1,7 +1,37 @@
 """小红书MCP服务智能体功能测试"""
 
+import asyncio
+import sys
+from types import ModuleType, SimpleNamespace
+
 import pytest
 from ai_social_scheduler.ai_agent.agents.mcp.xhs import create_xiaohongshu_mcp_agent, XiaohongshuMCPAgent
+from ai_social_scheduler.ai_agent.agents.mcp.xhs import xiaohongshu_mcp_agent as agent_module
+
+
+class FakeMCPClient:
+    """记录工具拉取次数的 MCP 客户端"""
+
+    fetch_count = 0
+
+    def __init__(self, connections):
+        self.connections = connections
+
+    async def get_tools(self):
+        FakeMCPClient.fetch_count += 1
+        await asyncio.sleep(0.01)
+        return [SimpleNamespace(name="check_login_status")]
+
+
+@pytest.fixture
+def fake_mcp(monkeypatch):
+    """替换 MCP 适配器，并隔离工具缓存"""
+    module = ModuleType("langchain_mcp_adapters.client")
+    module.MultiServerMCPClient = FakeMCPClient
+    monkeypatch.setitem(sys.modules, "langchain_mcp_adapters.client", module)
+    monkeypatch.setattr(agent_module, "_mcp_tools_cache", {})
+    FakeMCPClient.fetch_count = 0
+    return FakeMCPClient
 
 
 @pytest.mark.asyncio
@@ -54,6 +84,47 @@ async def test_agent_name():
     assert agent.name == "test_agent"
 
 
+@pytest.mark.asyncio
+async def test_mcp_tools_shared_per_service(fake_mcp):
+    """测试同一服务地址的并发初始化只拉取一次工具"""
+    results = await asyncio.gather(
+        *(agent_module._get_mcp_tools("http://mcp", "streamable_http") for _ in range(3))
+    )
+
+    assert fake_mcp.fetch_count == 1
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.asyncio
+async def test_close_refresh_refetches_mcp_tools(fake_mcp):
+    """测试 close(refresh=True) 丢弃共享缓存，之后重新拉取工具"""
+    agent = XiaohongshuMCPAgent(mcp_url="http://mcp", mcp_transport="streamable_http")
+    first = await agent_module._get_mcp_tools("http://mcp", "streamable_http")
+
+    await agent.close()
+    assert await agent_module._get_mcp_tools("http://mcp", "streamable_http") is first
+
+    await agent.close(refresh=True)
+    second = await agent_module._get_mcp_tools("http://mcp", "streamable_http")
+    assert second is not first
+    assert fake_mcp.fetch_count == 2
+
+
+def test_mcp_tools_lock_works_across_event_loops(fake_mcp):
+    """测试不同事件循环中并发拉取工具不会因共用锁而报错"""
+
+    async def fetch_concurrently(url):
+        await asyncio.gather(
+            agent_module._get_mcp_tools(url, "streamable_http"),
+            agent_module._get_mcp_tools(url, "streamable_http"),
+        )
+
+    asyncio.run(fetch_concurrently("http://mcp-a"))
+    asyncio.run(fetch_concurrently("http://mcp-b"))
+
+    assert fake_mcp.fetch_count == 2
+
+
 if __name__ == "__main__":
     # 简单运行测试
     import asyncio
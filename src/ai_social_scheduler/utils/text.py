@@ -3,11 +3,15 @@
 import re
 from typing import List
 
+# 正则在模块加载时编译一次
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_TAG_PATTERN = re.compile(r"#([^#]+)#")
+
 
 def clean_text(text: str) -> str:
     """清理文本"""
     # 移除多余空白
-    text = re.sub(r"\s+", " ", text)
+    text = _WHITESPACE_PATTERN.sub(" ", text)
     # 移除首尾空白
     text = text.strip()
     return text
@@ -16,7 +20,7 @@ def clean_text(text: str) -> str:
 def extract_tags(text: str) -> List[str]:
     """提取标签"""
     # 提取 #标签# 格式
-    tags = re.findall(r"#([^#]+)#", text)
+    tags = _TAG_PATTERN.findall(text)
     return tags
 
 
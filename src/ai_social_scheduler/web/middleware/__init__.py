@@ -1,4 +1,5 @@
 """中间件"""
 
-__all__ = []
+from .etag import ETagMiddleware
 
+__all__ = ["ETagMiddleware"]
@@ -0,0 +1,82 @@
+"""ETag 中间件"""
+
+import hashlib
+from typing import Optional
+
+from starlette.datastructures import MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp
+
+# 304 响应需要保留的响应头（RFC 9110 15.4.5），另外保留 Set-Cookie，
+# 否则路由设置或刷新的 Cookie 在客户端持有缓存 ETag 后会丢失
+_NOT_MODIFIED_HEADERS = frozenset(
+    {b"cache-control", b"content-location", b"date", b"etag", b"expires", b"vary", b"set-cookie"}
+)
+
+
+def _compute_etag(body: bytes) -> str:
+    """根据响应体计算 ETag"""
+    return f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """判断 If-None-Match 请求头是否命中 ETag"""
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ETagMiddleware(BaseHTTPMiddleware):
+    """ETag 中间件
+
+    为 GET 请求的 200 响应计算 ETag，请求头 If-None-Match 命中时返回空的 304 响应。
+    未设置 Cache-Control 的响应会补充默认值；路由可以自行设置 Cache-Control
+    （如按时间分桶的分析报告使用 "public, max-age=300"）覆盖默认值。
+    流式响应（没有 Content-Length）不做处理。
+    """
+
+    def __init__(self, app: ASGIApp, cache_control: Optional[str] = "private, max-age=0"):
+        """
+        初始化中间件
+
+        Args:
+            app: ASGI 应用
+            cache_control: 默认的 Cache-Control 值，为 None 时不设置
+        """
+        super().__init__(app)
+        self.cache_control = cache_control
+
+    async def dispatch(self, request: Request, call_next: RequestResponseEndpoint) -> Response:
+        response = await call_next(request)
+        if (
+            request.method != "GET"
+            or response.status_code != 200
+            or "content-length" not in response.headers
+            or "etag" in response.headers
+        ):
+            return response
+
+        body = b"".join([chunk async for chunk in response.body_iterator])
+        etag = _compute_etag(body)
+
+        # 基于原始响应头修改，保留 Set-Cookie 等重复出现的响应头
+        headers = MutableHeaders(raw=list(response.raw_headers))
+        headers["etag"] = etag
+        if self.cache_control and "cache-control" not in headers:
+            headers["cache-control"] = self.cache_control
+
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match and _etag_matches(if_none_match, etag):
+            not_modified = Response(status_code=304, background=response.background)
+            not_modified.raw_headers = [
+                (name, value) for name, value in headers.raw if name in _NOT_MODIFIED_HEADERS
+            ]
+            return not_modified
+
+        new_response = Response(content=body, status_code=response.status_code, background=response.background)
+        new_response.raw_headers = headers.raw
+        return new_response